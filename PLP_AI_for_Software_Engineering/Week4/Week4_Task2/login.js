@@ -0,0 +1,9 @@
+// Login check shared by login_page.html and the unit tests in test_login.py
+
+// Valid credentials for testing
+const VALID_USERNAME = 'testuser';
+const VALID_PASSWORD = 'Test@123';
+
+function authenticate(username, password) {
+    return username === VALID_USERNAME && password === VALID_PASSWORD;
+}